@@ -14,10 +14,20 @@ Responsibilities:
     - Detailed expandable explanations per player/stat
 """
 
+from pathlib import Path
+
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
-from engine.pick_engine import build_picks, RiskMode
+from engine.pick_engine import (
+    CACHE_TTL_SECONDS,
+    build_picks,
+    cache_bucket,
+    clear_cache,
+    load_players,
+    RiskMode,
+)
 from engine import ai_explainer
 
 
@@ -30,104 +40,14 @@ st.set_page_config(
 
 # ---------- CSS for styling (cards, badges, chips) ----------
 
-st.markdown(
-    """
-    <style>
-    .val-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: flex-start;
-        gap: 1.5rem;
-        margin-bottom: 0.75rem;
-    }
-    .val-title {
-        font-size: 2rem;
-        font-weight: 700;
-        margin: 0;
-    }
-    .val-subtitle {
-        color: #b3b3b3;
-        font-size: 0.95rem;
-        margin-top: 0.25rem;
-    }
-    .val-badges {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.4rem;
-        margin-top: 0.5rem;
-        margin-bottom: 0.75rem;
-    }
-    .badge {
-        padding: 0.25rem 0.6rem;
-        border-radius: 999px;
-        font-size: 0.8rem;
-        border: 1px solid rgba(255,255,255,0.15);
-        background: rgba(255,255,255,0.03);
-    }
-    .badge-strong {
-        border-color: rgba(56,189,248,0.8);
-        background: rgba(56,189,248,0.12);
-    }
-    .card {
-        border-radius: 0.9rem;
-        padding: 0.9rem 1rem;
-        border: 1px solid rgba(255,255,255,0.06);
-        background: rgba(15,15,20,0.95);
-        box-shadow: 0 12px 30px rgba(0,0,0,0.25);
-    }
-    .card-soft {
-        border-radius: 0.9rem;
-        padding: 0.9rem 1rem;
-        border: 1px solid rgba(255,255,255,0.05);
-        background: rgba(20,20,30,0.9);
-    }
-    .card-title {
-        font-weight: 600;
-        font-size: 1rem;
-        margin-bottom: 0.25rem;
-    }
-    .card-sub {
-        font-size: 0.85rem;
-        color: #b3b3b3;
-        margin-bottom: 0.35rem;
-    }
-    .chip {
-        display: inline-block;
-        padding: 0.1rem 0.45rem;
-        border-radius: 999px;
-        font-size: 0.75rem;
-        border: 1px solid rgba(255,255,255,0.2);
-        margin-right: 0.25rem;
-    }
-    .chip-over {
-        border-color: rgba(34,197,94,0.8);
-        background: rgba(34,197,94,0.12);
-    }
-    .chip-under {
-        border-color: rgba(248,113,113,0.9);
-        background: rgba(248,113,113,0.12);
-    }
-    .chip-stay {
-        border-color: rgba(148,163,184,0.9);
-        background: rgba(148,163,184,0.12);
-    }
-    .chip-conf {
-        border-color: rgba(250,204,21,0.9);
-        background: rgba(250,204,21,0.1);
-    }
-    .metric-label {
-        font-size: 0.8rem;
-        color: #9ca3af;
-        margin-bottom: 0.2rem;
-    }
-    .metric-value {
-        font-size: 1.25rem;
-        font-weight: 600;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    """Read the stylesheet once; it never changes between reruns."""
+    return (Path(__file__).parent / "assets" / "style.css").read_text(encoding="utf-8")
+
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # ---------- Header ----------
 
@@ -213,37 +133,101 @@ confidence_rank = {"Low": 0, "Medium": 1, "High": 2}
 
 st.sidebar.caption("Data source: vlrggapi (unofficial VLR stats API).")
 
+# Picks are cached for a few minutes; this forces fresh numbers right away
+refresh_clicked = st.sidebar.button("Refresh stats")
+
 # ---------- Fetch & build picks from the engine ----------
 
+
+@st.cache_resource
+def _openai_client():
+    """
+    One OpenAI client per process, shared by every session and rerun
+    (so its HTTP connection pool is reused too).
+    """
+    return ai_explainer.create_client()
+
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner="Pulling stats and computing AI edges...")
+def _cached_build_picks(region: str, timespan: str, risk_mode: RiskMode, ttl_bucket: int):
+    """
+    Memoized wrapper around engine.build_picks(...).
+
+    Streamlit re-runs this whole script on every widget change, but only
+    region / timespan / risk actually change the picks. Caching on those three
+    means stat type, search and confidence edits skip the API + modeling work.
+
+    `ttl_bucket` is the engine's cache window (cache_bucket()), so this cache
+    expires on the same clock as the engine's own and never serves stats older
+    than one window. The ttl only evicts entries from past windows.
+    """
+    return build_picks(region=region, timespan=timespan, risk_mode=risk_mode)
+
+
+if refresh_clicked:
+    clear_cache()
+    _cached_build_picks.clear()
+
 try:
-    with st.spinner("Pulling stats and computing AI edges..."):
-        # Call into the engine (this does API fetch + modeling)
-        picks = build_picks(region=region, timespan=timespan, risk_mode=risk_mode)
+    # Call into the engine (this does API fetch + modeling, cached for the
+    # current 5-minute window)
+    picks = _cached_build_picks(
+        region=region, timespan=timespan, risk_mode=risk_mode, ttl_bucket=cache_bucket()
+    )
+    # Player pool straight from the engine: build_picks leaves out near-zero
+    # edges, so counting handles in `picks` would miss some players
+    total_players = len({player.handle for player in load_players(region, timespan)})
 except Exception as e:
     st.error(f"Error fetching stats from vlrggapi: {e}")
     st.stop()
 
-# Filter picks based on UI controls
-filtered_picks = [
-    p
-    for p in picks
-    if p.stat_type in stat_type_filter
-    and confidence_rank[p.confidence] >= confidence_rank[min_confidence]
-    and matches_search(p, search_term)
-]
+# Filter picks based on UI controls. The same single pass also collects
+# everything else the page needs: the metric counts and the rows for the
+# full table.
+min_rank = confidence_rank[min_confidence]
+filtered_picks = []
+table_rows = []
+rec_counts = {"Lean Over": 0, "Lean Under": 0, "Stay Away": 0}
+edge_sum = 0.0
+for p in picks:
+    if not (
+        p.stat_type in stat_type_filter
+        and confidence_rank[p.confidence] >= min_rank
+        and matches_search(p, search_term)
+    ):
+        continue
+    filtered_picks.append(p)
+    rec_counts[p.recommendation] += 1
+    edge_sum += abs(p.edge)
+    table_rows.append(
+        {
+            "player_handle": p.player_handle,
+            "team_name": p.team_name,
+            "stat_type": p.stat_type,
+            "line_value": p.line_value,
+            "projected_value": p.projected_value,
+            "edge": p.edge,
+            "probability_over": p.probability_over,
+            "recommendation": p.recommendation,
+            "confidence": p.confidence,
+        }
+    )
 
 # If nothing passes the filters, show a warning and stop rendering
 if not filtered_picks:
     st.warning("No picks match your filters. Try lowering confidence or changing risk/region.")
     st.stop()
-    
+
+# Filtered picks as a DataFrame for the full table
+fp_df = pd.DataFrame(table_rows)
+
 # Make sure we have somewhere to store per-pick chat history
 if "chat_state" not in st.session_state:
     st.session_state["chat_state"] = {}
 
 # ---------- Badges & top-level metrics ----------
 
-total_players = len({p.player_handle for p in picks})
 total_picks = len(picks)
 
 # Badge strip summarizing context
@@ -261,10 +245,10 @@ st.markdown(
 )
 
 # Simple metrics
-over_count = sum(1 for p in filtered_picks if p.recommendation == "Lean Over")
-under_count = sum(1 for p in filtered_picks if p.recommendation == "Lean Under")
-stay_count = sum(1 for p in filtered_picks if p.recommendation == "Stay Away")
-avg_edge = sum(abs(p.edge) for p in filtered_picks) / len(filtered_picks)
+over_count = rec_counts["Lean Over"]
+under_count = rec_counts["Lean Under"]
+stay_count = rec_counts["Stay Away"]
+avg_edge = edge_sum / len(filtered_picks)
 
 # Four metric cards in one row
 c1, c2, c3, c4 = st.columns(4)
@@ -293,50 +277,71 @@ with c4:
 
 st.markdown("### 🔝 Top 3 AI Picks")
 
-# Take the first 3 picks (already sorted by |edge| in the engine)
-top3 = filtered_picks[:3]
-cols_top = st.columns(len(top3))
-
-for p, col in zip(top3, cols_top):
-    # Determine chip style based on recommendation
-    chip_class = (
-        "chip-over"
-        if p.recommendation == "Lean Over"
-        else "chip-under"
-        if p.recommendation == "Lean Under"
-        else "chip-stay"
-    )
-    with col:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        # Player name
-        st.markdown(f'<div class="card-title">{p.player_handle}</div>', unsafe_allow_html=True)
-        # Team + role
-        st.markdown(
-            f'<div class="card-sub">{p.team_name} • {p.role or "Unknown role"}</div>',
-            unsafe_allow_html=True,
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=64, show_spinner=False)
+def _top3_html(cards: tuple) -> str:
+    """
+    Build the HTML for the top-3 feature cards as one flexbox row.
+
+    `cards` holds one plain tuple of display fields per pick, so the result is
+    cached per distinct top-3 and the whole row renders as a single element.
+    The cache is shared by all sessions, so it is bounded (64 entries, expiring
+    with the stats window).
+    """
+    html = ['<div class="val-top3">']
+    for handle, team, role, stat_type, rec, conf, line, proj, edge, prob_over in cards:
+        # Determine chip style based on recommendation
+        chip_class = (
+            "chip-over"
+            if rec == "Lean Over"
+            else "chip-under"
+            if rec == "Lean Under"
+            else "chip-stay"
         )
-        # Recommendation chips (Over/Under/Stay + confidence)
-        st.markdown(
-            f"""
-            <div style="margin-bottom: 0.45rem;">
-              <span class="chip {chip_class}">{p.recommendation}</span>
-              <span class="chip chip-conf">{p.confidence} conf</span>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        html.append(
+            '<div class="card">'
+            # Player name
+            f'<div class="card-title">{handle}</div>'
+            # Team + role
+            f'<div class="card-sub">{team} • {role or "Unknown role"}</div>'
+            # Recommendation chips (Over/Under/Stay + confidence)
+            '<div style="margin-bottom: 0.45rem;">'
+            f'<span class="chip {chip_class}">{rec}</span>'
+            f'<span class="chip chip-conf">{conf} conf</span>'
+            "</div>"
+            # Line, projection, edge, probability
+            '<div style="font-size:0.85rem; color:#d1d5db;">'
+            f"Stat: <b>{stat_type.upper()}</b><br/>"
+            f"Line: <b>{line:.1f}</b> &nbsp; Projection: <b>{proj:.1f}</b><br/>"
+            f"Edge: <b>{edge:.2f}</b> &nbsp; P(Over): <b>{prob_over*100:.0f}%</b>"
+            "</div>"
+            "</div>"
         )
-        # Line, projection, edge, probability
-        st.markdown(
-            f"""
-            <div style="font-size:0.85rem; color:#d1d5db;">
-              Stat: <b>{p.stat_type.upper()}</b><br/>
-              Line: <b>{p.line_value:.1f}</b> &nbsp; Projection: <b>{p.projected_value:.1f}</b><br/>
-              Edge: <b>{p.edge:.2f}</b> &nbsp; P(Over): <b>{p.probability_over*100:.0f}%</b>
-            </div>
-            """,
-            unsafe_allow_html=True,
+    html.append("</div>")
+    return "".join(html)
+
+
+# Take the first 3 picks (already sorted by |edge| in the engine)
+top3 = filtered_picks[:3]
+st.markdown(
+    _top3_html(
+        tuple(
+            (
+                p.player_handle,
+                p.team_name,
+                p.role,
+                p.stat_type,
+                p.recommendation,
+                p.confidence,
+                round(p.line_value, 2),
+                round(p.projected_value, 2),
+                round(p.edge, 2),
+                round(p.probability_over, 3),
+            )
+            for p in top3
         )
-        st.markdown('</div>', unsafe_allow_html=True)
+    ),
+    unsafe_allow_html=True,
+)
 
 # ---------- Tabs: full table + explanations ----------
 
@@ -345,30 +350,62 @@ tab_table, tab_explain = st.tabs(["📊 Full table", "🧠 AI explanations"])
 with tab_table:
     st.markdown("#### Ranked pick list")
 
-    # Convert PickResult objects into a DataFrame for display
-    table_df = pd.DataFrame(
-        [
-            {
-                "Player": p.player_handle,
-                "Team": p.team_name,
-                "Stat": p.stat_type,
-                "Line": p.line_value,
-                "Projection": round(p.projected_value, 2),
-                "Edge": round(p.edge, 2),
-                "P(Over)": round(p.probability_over * 100, 1),
-                "Recommendation": p.recommendation,
-                "Confidence": p.confidence,
+    # Relabel the DataFrame's columns and hand Streamlit an Arrow table
+    # (its native wire format, so it skips its own pandas -> Arrow conversion).
+    # Display rounding is done by column_config instead of copying rounded columns.
+    table_arrow = pa.Table.from_pandas(
+        fp_df.assign(probability_over=fp_df["probability_over"] * 100).rename(
+            columns={
+                "player_handle": "Player",
+                "team_name": "Team",
+                "stat_type": "Stat",
+                "line_value": "Line",
+                "projected_value": "Projection",
+                "edge": "Edge",
+                "probability_over": "P(Over)",
+                "recommendation": "Recommendation",
+                "confidence": "Confidence",
             }
-            for p in filtered_picks
-        ]
+        ),
+        preserve_index=False,
     )
 
     # Display the table with Streamlit's dataframe component
-    st.dataframe(table_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        table_arrow,
+        column_config={
+            "Line": st.column_config.NumberColumn(format="%.1f"),
+            "Projection": st.column_config.NumberColumn(format="%.2f"),
+            "Edge": st.column_config.NumberColumn(format="%.2f"),
+            "P(Over)": st.column_config.NumberColumn(format="%.1f%%"),
+        },
+        use_container_width=True,
+        hide_index=True,
+    )
 
 with tab_explain:
     st.markdown("#### Individual AI breakdowns")
 
+    # Ensure a chat_state entry exists for every pick (keyed by player + stat)
+    for p in filtered_picks:
+        st.session_state["chat_state"].setdefault(
+            f"{p.player_handle}-{p.stat_type}",
+            {"initial": None, "history": []},
+        )
+
+    # Initial AI breakdowns are generated on demand, so we only pay for the
+    # picks someone actually opens. "Explain all" batches the rest in parallel.
+    missing = [
+        p
+        for p in filtered_picks
+        if st.session_state["chat_state"][f"{p.player_handle}-{p.stat_type}"]["initial"] is None
+    ]
+    if missing and st.button(f"Explain all {len(missing)} remaining picks", key="explain-all-btn"):
+        with st.spinner("Asking VALCoach for explanations..."):
+            explanations = ai_explainer.generate_explanations_bulk(_openai_client(), missing)
+        for p, explanation in zip(missing, explanations):
+            st.session_state["chat_state"][f"{p.player_handle}-{p.stat_type}"]["initial"] = explanation
+
     # One expander per pick, with an AI-generated explanation and follow-up Q&A
     for p in filtered_picks:
         label = (
@@ -378,44 +415,44 @@ with tab_explain:
 
         # Key to identify this pick's chat thread
         pick_key = f"{p.player_handle}-{p.stat_type}"
-
-        # Ensure chat_state entry exists
-        chat_state = st.session_state["chat_state"].setdefault(
-            pick_key,
-            {"initial": None, "history": []},
-        )
+        chat_state = st.session_state["chat_state"][pick_key]
 
         with st.expander(label):
-            # Basic numeric info
-            st.write(f"**Team:** {p.team_name}")
-            st.write(f"**Role:** {p.role or 'Unknown'}")
-            st.write(
+            # Basic numeric info + section header, sent as one markdown element
+            # (one delta per block instead of one per line keeps big lists snappy)
+            st.markdown(
+                f"**Team:** {p.team_name}\n\n"
+                f"**Role:** {p.role or 'Unknown'}\n\n"
                 f"**Line:** {p.line_value:.1f} | "
                 f"**Projection:** {p.projected_value:.1f} | "
                 f"**Edge:** {p.edge:.2f} | "
-                f"**P(Over):** {p.probability_over*100:.1f}%"
+                f"**P(Over):** {p.probability_over*100:.1f}%\n\n"
+                "### 🧠 AI Breakdown"
             )
 
-            # 1) Initial AI breakdown (only generated once per pick)
-            if chat_state["initial"] is None:
-                with st.spinner("Asking VALCoach for an explanation..."):
-                    explanation = ai_explainer.generate_initial_explanation(p)
-                chat_state["initial"] = explanation
-
-            st.markdown("### 🧠 AI Breakdown")
-            st.write(chat_state["initial"])
+            # 1) Initial AI breakdown (only generated once asked for, then kept).
+            #    Streamed so the text shows up as the model writes it.
+            if chat_state["initial"] is not None:
+                st.write(chat_state["initial"])
+            elif st.button("Explain this pick", key=f"explain-btn-{pick_key}"):
+                chat_state["initial"] = st.write_stream(
+                    ai_explainer.stream_initial_explanation(_openai_client(), p)
+                )
 
-            # 2) Show previous follow-up Q&A, if any
+            # 2) Previous follow-up Q&A (if any) and 3) the follow-up prompt header,
+            #    joined into a single markdown element
+            followup_md = []
             if chat_state["history"]:
-                st.markdown("### 💬 Follow-up Q&A")
+                followup_md.append("### 💬 Follow-up Q&A")
                 for turn in chat_state["history"]:
                     if turn["role"] == "user":
-                        st.markdown(f"**You:** {turn['content']}")
+                        followup_md.append(f"**You:** {turn['content']}")
                     else:
-                        st.markdown(f"> **VALCoach:** {turn['content']}")
+                        followup_md.append(f"> **VALCoach:** {turn['content']}")
+            followup_md.append("#### Ask a follow-up")
+            st.markdown("\n\n".join(followup_md))
 
             # 3) Follow-up question input
-            st.markdown("#### Ask a follow-up")
             q = st.text_input(
                 f"Question about {p.player_handle} ({p.stat_type})",
                 placeholder="e.g. What does KAST stand for? Why is this edge big?",
@@ -430,6 +467,7 @@ with tab_explain:
 
                 with st.spinner("VALCoach is thinking..."):
                     answer = ai_explainer.answer_followup(
+                        _openai_client(),
                         p,
                         chat_state["history"],
                     )
@@ -3,19 +3,41 @@ data/vlrgg_client.py
 
 This module is responsible for:
 - Talking to the vlrggapi REST API to fetch Valorant player stats.
-- Converting the raw JSON data into a cleaned, structured list of "player" dictionaries
+- Converting the raw JSON data into a cleaned, structured list of Player records
   that the model/engine can consume.
 """
 
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Tuple
 
-import pandas as pd
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Base URL for the vlrggapi project (from the GitHub README)
 VLRGG_BASE_URL = "http://ec2-34-230-77-141.compute-1.amazonaws.com:3001"
 
+# One shared HTTP session so repeated fetches (other regions / timespans)
+# reuse pooled keep-alive connections instead of reconnecting every time.
+# Transient server errors are retried a few times with a short backoff.
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET",),
+    ),
+)
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip", "User-Agent": "VALCoach/1.0"})
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
 # Modeling assumption:
 # - A typical Valorant pro map runs ~22 rounds (e.g., 13–9, 13–10, etc.).
 # - We use this to convert kills_per_round -> kills_per_map.
@@ -30,7 +52,7 @@ AGENT_TO_ROLE: Dict[str,str] = {
     "iso": "duelist",
     "reyna": "duelist",
     "waylay": "duelist",
-    "pheonix": "duelist",
+    "phoenix": "duelist",
     
     # Controller
     "omen": "controller",
@@ -58,6 +80,34 @@ AGENT_TO_ROLE: Dict[str,str] = {
     "chamber": "sentinels",
     "veto": "sentinels",
 }
+# Normalize keys once so lookups can compare against lowercased agent names
+AGENT_TO_ROLE = {k.lower(): v for k, v in AGENT_TO_ROLE.items()}
+# Known agent names, for a cheap membership test before the role lookup
+_AGENT_KEYS = frozenset(AGENT_TO_ROLE)
+
+# Splits agent strings like "Jett, Raze" or "Jett / Raze" (compiled once)
+_AGENT_SPLIT_RE = re.compile(r"[,/]+")
+
+
+class Player(NamedTuple):
+    """
+    One cleaned player record, as produced by build_players_from_stats.
+
+    A NamedTuple rather than a dict: fields are read as attributes
+    (player.rating), the record is immutable and hashable, and it is smaller
+    than the equivalent dict. Use player._asdict() when a mapping is needed.
+    """
+    id: str                 # unique machine-friendly id
+    handle: str             # in-game name
+    team: str               # org tag (or "Unknown")
+    role: str               # inferred from agents played (see _infer_role_from_agents)
+    kills_per_map: float    # expected kills in a typical map
+    assists_per_map: float  # expected assists in a typical map
+    rating: float           # overall player rating
+    kast: float             # KAST value (0–1)
+    maps_played: int        # approximate number of maps in this window
+    consistency: float      # a 0–1 score based on rating and KAST
+
 
 def _float_safe(x, default: float = 0.0) -> float:
     """
@@ -68,8 +118,17 @@ def _float_safe(x, default: float = 0.0) -> float:
         _float_safe("1.23") -> 1.23
         _float_safe("not a number", 0.0) -> 0.0
     """
+    return _float_from_str(str(x), default)
+
+
+@lru_cache(maxsize=2048)
+def _float_from_str(s: str, default: float) -> float:
+    """
+    Memoized core of _float_safe. API stats repeat a lot ("1.05", "0.78", ...),
+    so most calls become a dict lookup instead of a parse.
+    """
     try:
-        return float(str(x))
+        return float(s)
     except Exception:
         return default
 
@@ -80,12 +139,20 @@ def _parse_kast(kast_raw: Any) -> float:
 
     If parsing fails, we fall back to a reasonable baseline (0.70).
     """
+    return _kast_from_str(str(kast_raw))
+
+
+@lru_cache(maxsize=2048)
+def _kast_from_str(kast_str: str) -> float:
+    """
+    Memoized core of _parse_kast (KAST values come from a small set like "71%").
+    """
     try:
-        s = str(kast_raw).replace("%", "")  # "72%" -> "72"
-        return float(s) / 100.0             # "72" -> 0.72
+        s = kast_str.replace("%", "")  # "72%" -> "72"
+        return float(s) / 100.0        # "72" -> 0.72
     except Exception:
         return 0.70
-    
+
 def _infer_role_from_agents(agents_raw: Any) -> str:
     """
     Infer a tactical role (Duelist / Controller / Initiator / Sentinel / Flex)
@@ -99,7 +166,7 @@ def _infer_role_from_agents(agents_raw: Any) -> str:
     For now, we:
       - normalize names to lowercase,
       - check against AGENT_TO_ROLE,
-      - pick the first matching role we see,
+      - use that role if every recognized agent shares it,
       - default to "Flex" if we see multiple different roles,
       - default to "Unknown" if we get nothing useful.
     """
@@ -109,7 +176,7 @@ def _infer_role_from_agents(agents_raw: Any) -> str:
     # Turn into a list of strings.
     if isinstance(agents_raw, str):
         # Split on commas or slashes, e.g. "Jett, Raze" or "Jett / Raze"
-        parts = re.split(r"[,/]+", agents_raw)
+        parts = _AGENT_SPLIT_RE.split(agents_raw)
         agent_names = [p.strip().lower() for p in parts if p.strip()]
     elif isinstance(agents_raw, (list, tuple)):
         agent_names = [str(a).strip().lower() for a in agents_raw if str(a).strip()]
@@ -121,24 +188,56 @@ def _infer_role_from_agents(agents_raw: Any) -> str:
         return "Unknown"
 
     # Collect all roles we can recognize
-    roles_seen = []
-    for name in agent_names:
-        role = AGENT_TO_ROLE.get(name)
-        if role and role not in roles_seen:
-            roles_seen.append(role)
+    roles_seen = {AGENT_TO_ROLE[name] for name in agent_names if name in _AGENT_KEYS}
 
     if not roles_seen:
         # None of the agents matched our mapping
         return "Unknown"
     if len(roles_seen) == 1:
         # Clear single-role player: e.g. pure Duelist main
-        return roles_seen[0]
+        return next(iter(roles_seen))
 
     # Mixed roles (e.g., plays Duelist + Initiator); call that Flex.
     return "Flex"
 
 
-def fetch_vlr_stats(region: str = "na", timespan: str = "30") -> pd.DataFrame:
+def _player_metrics(
+    rating: np.ndarray,
+    kpr: np.ndarray,
+    apr: np.ndarray,
+    kast: np.ndarray,
+    rounds_played: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the derived per-player numbers for all players at once.
+
+    Inputs are aligned float arrays (one entry per player). Returns
+    (kills_per_map, assists_per_map, maps_played, consistency) arrays in the
+    same order. Plain NumPy array math, so it stays fast even if we lift the
+    top-40 cut to a full region's player pool.
+    """
+    # Convert from per-round --> per-map using our average rounds assumption
+    kills_per_map = kpr * EXPECTED_ROUNDS_PER_MAP
+    assists_per_map = apr * EXPECTED_ROUNDS_PER_MAP
+
+    # Convert total rounds into approximate maps (at least 1)
+    maps_played = np.maximum(1, np.rint(rounds_played / EXPECTED_ROUNDS_PER_MAP)).astype(int)
+
+    # Build a simple consistency score from rating + KAST, scaled 0–1.
+    # This is NOT rigorous math; it's a hacky but interpretable metric.
+    # The idea:
+    #   - If KAST is much higher than 0.65 and rating is much higher than 0.9,
+    #     then consistency should approach 1.
+    consistency = np.clip(
+        0.5 * (kast - 0.65) / 0.15 + 0.5 * (rating - 0.9) / 0.4,
+        0.0,
+        1.0,
+    )
+
+    return kills_per_map, assists_per_map, maps_played, consistency
+
+
+def fetch_vlr_segments(region: str = "na", timespan: str = "30") -> List[Dict[str, Any]]:
     """
     Fetch player stats from vlrggapi for a specific region and time window.
 
@@ -147,72 +246,64 @@ def fetch_vlr_stats(region: str = "na", timespan: str = "30") -> pd.DataFrame:
         timespan: Time window (as a string), e.g. "30" (last 30 days), "90", or "all".
 
     Returns:
-        A pandas DataFrame where each row is a player and each column is a stat,
-        as provided by the vlrggapi /stats endpoint.
+        A list of dicts, one per player, each mapping stat name -> raw value
+        as provided by the vlrggapi /stats endpoint (empty if nothing came back).
     """
     # Build query parameters for the API call
     params = {"region": region, "timespan": timespan}
 
     # Perform the HTTP GET request
-    resp = requests.get(f"{VLRGG_BASE_URL}/stats", params=params, timeout=10)
+    resp = _SESSION.get(f"{VLRGG_BASE_URL}/stats", params=params, timeout=10)
 
     # Raise an error if the status code is not 200 OK
     resp.raise_for_status()
 
-    # Parse the JSON payload
-    payload = resp.json()
+    # Parse the JSON payload (orjson is noticeably faster than the stdlib parser)
+    payload = orjson.loads(resp.content)
 
     # The relevant data is under payload["data"]["segments"]
-    segments = payload.get("data", {}).get("segments", [])
-
-    # If no segments returned, return an empty DataFrame
-    if not segments:
-        return pd.DataFrame()
-
-    # Convert the list of dicts into a pandas DataFrame for easier processing
-    return pd.DataFrame(segments)
+    return payload.get("data", {}).get("segments", []) or []
 
 
-def build_players_from_stats(df: pd.DataFrame) -> List[Dict[str, Any]]:
+def build_players_from_stats(segments: List[Dict[str, Any]]) -> List[Player]:
     """
     Transform vlrggapi /stats rows into a simple player structure used by the model.
 
-    For each player row in the DataFrame, we produce a dictionary with fields:
-
-        {
-          "id": unique machine-friendly id,
-          "handle": in-game name,
-          "team": org tag (or "Unknown"),
-          "role": (placeholder for now, "Unknown"),
-          "kills_per_map": expected kills in a typical map,
-          "assists_per_map": expected assists in a typical map,
-          "rating": overall player rating,
-          "kast": KAST value (0–1),
-          "maps_played": approximate number of maps in this window,
-          "consistency": a 0–1 score based on rating and KAST
-        }
+    For each player record in `segments`, we produce a Player with fields:
+
+        id, handle, team, role,
+        kills_per_map, assists_per_map, rating, kast,
+        maps_played, consistency
+
+    (see Player for what each one means).
 
     This function is the bridge between the raw API and our modeling logic.
+    The records are already plain dicts, so we sort and walk them directly
+    rather than paying for a DataFrame round-trip.
     """
-    players: List[Dict[str, Any]] = []
+    players: List[Player] = []
 
-    # If there's no data, return an empty list
-    if df.empty:
+    if not segments:
         return players
 
-    # Work on a copy so we don't modify the original DataFrame
-    df = df.copy()
-
-    # Convert "rating" into a numeric column for sorting players by performance
-    df["rating_float"] = df["rating"].apply(lambda x: _float_safe(x, 1.0))
-
-    # Keep the top ~40 players by rating to keep the UI manageable
-    df = df.sort_values("rating_float", ascending=False).head(40)
-
-    # Iterate over each row (each player)
-    for _, row in df.iterrows():
+    # Keep the top ~40 players by rating to keep the UI manageable.
+    # argpartition picks the top 40 in O(N); only those 40 get fully sorted
+    # (stable, so equal ratings keep their API order).
+    all_ratings = np.array(
+        [_float_safe(row.get("rating"), 1.0) for row in segments],
+        dtype=np.float64,
+    )
+    k = min(40, len(segments))
+    top_idx = np.sort(np.argpartition(-all_ratings, k - 1)[:k])
+    top_idx = top_idx[np.argsort(-all_ratings[top_idx], kind="stable")]
+    top = [segments[i] for i in top_idx]
+
+    # Pull the identity fields and raw stats out of each record (each player)
+    identities = []
+    kprs, aprs, kasts, rounds = [], [], [], []
+    for row in top:
         # Player handle (in-game name)
-        handle = str(row["player"]).strip()
+        handle = str(row.get("player", "")).strip()
 
         # Team / org name; default to "Unknown" if missing
         team = str(row.get("org", "")).strip() or "Unknown"
@@ -221,58 +312,60 @@ def build_players_from_stats(df: pd.DataFrame) -> List[Dict[str, Any]]:
         raw_id = f"{team}_{handle}".lower()
         player_id = re.sub(r"[^a-z0-9]+", "", raw_id) or handle.lower()
 
-        # Basic stats from the API
-        rating = _float_safe(row["rating"], 1.0)
-        kpr = _float_safe(row.get("kills_per_round", 0.8), 0.8)     # kills per round
-        apr = _float_safe(row.get("assists_per_round", 0.3), 0.3)   # assists per round
-        kast = _parse_kast(row.get("kill_assists_survived_traded", "70%"))
-
-        # Convert from per-round --> per-map using our average rounds assumption
-        kills_per_map = kpr * EXPECTED_ROUNDS_PER_MAP
-        assists_per_map = apr * EXPECTED_ROUNDS_PER_MAP
-
-        # Approximate total rounds played.
-        # If the API doesn't give "rounds_played", assume ~10 maps worth of rounds.
-        rounds_played = _float_safe(
-            row.get("rounds_played", EXPECTED_ROUNDS_PER_MAP * 10),
-            EXPECTED_ROUNDS_PER_MAP * 10,
-        )
-        # Convert total rounds into approximate maps
-        maps_played = max(1, round(rounds_played / EXPECTED_ROUNDS_PER_MAP))
-
-        # Build a simple consistency score from rating + KAST, scaled 0–1.
-        # This is NOT rigorous math; it's a hacky but interpretable metric.
-        # The idea:
-        #   - If KAST is much higher than 0.65 and rating is much higher than 0.9,
-        #     then consistency should approach 1.
-        consistency = max(
-            0.0,
-            min(
-                1.0,
-                0.5 * (kast - 0.65) / 0.15 + 0.5 * (rating - 0.9) / 0.4,
-            ),
-        )
-        
         agents_raw = (
             row.get("agents")
             or row.get("agent")
         )
         role = _infer_role_from_agents(agents_raw)
+        identities.append((player_id, handle, team, role))
+
+        # Basic stats from the API
+        kprs.append(_float_safe(row.get("kills_per_round", 0.8), 0.8))     # kills per round
+        aprs.append(_float_safe(row.get("assists_per_round", 0.3), 0.3))   # assists per round
+        kasts.append(_parse_kast(row.get("kill_assists_survived_traded", "70%")))
+
+        # Approximate total rounds played.
+        # If the API doesn't give "rounds_played", assume ~10 maps worth of rounds.
+        rounds.append(
+            _float_safe(
+                row.get("rounds_played", EXPECTED_ROUNDS_PER_MAP * 10),
+                EXPECTED_ROUNDS_PER_MAP * 10,
+            )
+        )
 
-        # Finally, collect the data for this player
+    rating = all_ratings[top_idx]
+    kast = np.array(kasts, dtype=np.float64)
+    kills_per_map, assists_per_map, maps_played, consistency = _player_metrics(
+        rating=rating,
+        kpr=np.array(kprs, dtype=np.float64),
+        apr=np.array(aprs, dtype=np.float64),
+        kast=kast,
+        rounds_played=np.array(rounds, dtype=np.float64),
+    )
+
+    # Finally, collect the data for each player (as plain Python numbers)
+    for (player_id, handle, team, role), kpm, apm, rat, kst, maps, cons in zip(
+        identities,
+        kills_per_map.tolist(),
+        assists_per_map.tolist(),
+        rating.tolist(),
+        kast.tolist(),
+        maps_played.tolist(),
+        consistency.tolist(),
+    ):
         players.append(
-            {
-                "id": player_id,
-                "handle": handle,
-                "team": team,
-                "role": role,
-                "kills_per_map": kills_per_map,
-                "assists_per_map": assists_per_map,
-                "rating": rating,
-                "kast": kast,
-                "maps_played": maps_played,
-                "consistency": consistency,
-            }
+            Player(
+                id=player_id,
+                handle=handle,
+                team=team,
+                role=role,
+                kills_per_map=kpm,
+                assists_per_map=apm,
+                rating=rat,
+                kast=kst,
+                maps_played=maps,
+                consistency=cons,
+            )
         )
 
     return players
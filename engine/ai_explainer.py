@@ -1,10 +1,68 @@
 # engine/ai_explainer.py
 
-from typing import Any, Dict, List
-from openai import OpenAI
-import streamlit as st
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
-client = OpenAI()
+# Initial explanations keyed by pick fingerprint (see _pick_fingerprint).
+# Shared across reruns/sessions, so it is bounded: entries expire after
+# _EXPLANATION_CACHE_TTL_SECONDS and the least recently used ones are evicted
+# past _EXPLANATION_CACHE_MAXSIZE. The lock keeps it safe for the bulk thread pool.
+_EXPLANATION_CACHE_TTL_SECONDS = 3600
+_EXPLANATION_CACHE_MAXSIZE = 512
+# fingerprint -> (monotonic time stored, explanation), oldest use first
+_EXPLANATION_CACHE: OrderedDict[Tuple[Any, ...], Tuple[float, str]] = OrderedDict()
+_EXPLANATION_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(fingerprint: Tuple[Any, ...]) -> Optional[str]:
+    """Return the cached explanation for `fingerprint`, or None if missing/expired."""
+    with _EXPLANATION_CACHE_LOCK:
+        entry = _EXPLANATION_CACHE.get(fingerprint)
+        if entry is None:
+            return None
+        stored_at, explanation = entry
+        if time.monotonic() - stored_at > _EXPLANATION_CACHE_TTL_SECONDS:
+            del _EXPLANATION_CACHE[fingerprint]
+            return None
+        _EXPLANATION_CACHE.move_to_end(fingerprint)
+        return explanation
+
+
+def _cache_put(fingerprint: Tuple[Any, ...], explanation: str) -> None:
+    """Store a non-empty explanation, evicting the least recently used past the max size."""
+    if not explanation:
+        # An empty completion is a failure, not an answer; let the next call retry
+        return
+    with _EXPLANATION_CACHE_LOCK:
+        _EXPLANATION_CACHE[fingerprint] = (time.monotonic(), explanation)
+        _EXPLANATION_CACHE.move_to_end(fingerprint)
+        while len(_EXPLANATION_CACHE) > _EXPLANATION_CACHE_MAXSIZE:
+            _EXPLANATION_CACHE.popitem(last=False)
+
+
+def create_client() -> OpenAI:
+    """
+    Build the OpenAI client (reads OPENAI_API_KEY etc. from the environment).
+
+    This module stays UI-agnostic: callers create the client once and pass it
+    into the functions below (the Streamlit app keeps it in st.cache_resource).
+
+    The underlying HTTP client speaks HTTP/2 with a pool big enough for the
+    bulk thread pool, so concurrent explanation requests share one connection
+    as parallel streams instead of queueing behind each other.
+    """
+    http_client = DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        timeout=30.0,
+    )
+    return OpenAI(http_client=http_client)
 
 
 SYSTEM_PROMPT = """
@@ -25,36 +83,70 @@ Style:
 """
 
 
-def _format_player_context(player: Dict[str, Any]) -> str:
+def _format_player_context(player: Any) -> str:
     """
-    Turn the raw player dict into a readable block the model can use
+    Turn the raw Player record into a readable block the model can use
     as 'retrieved knowledge'. This is your RAG-style context.
     """
     lines = []
-    for k, v in sorted(player.items()):
+    for k, v in sorted(player._asdict().items()):
         lines.append(f"- {k}: {v}")
     return "\n".join(lines)
 
 
-def _build_initial_messages(pick: Any) -> List[Dict[str, str]]:
+def _pick_fingerprint(pick: Any) -> Tuple[Any, ...]:
     """
-    Build the base messages for explaining a single pick.
-    Assumes pick is a PickResult from engine.pick_engine.
+    Snapshot everything the prompt uses from a PickResult as a tuple of plain
+    values. Numbers are rounded to the precision we show the model, so the
+    tuple doubles as a stable cache key across Streamlit reruns (the Player
+    record is an immutable NamedTuple, so it goes in as-is).
+    """
+    return (
+        pick.player_handle,
+        pick.team_name,
+        pick.role,
+        pick.stat_type,
+        round(pick.line_value, 2),
+        round(pick.projected_value, 2),
+        round(pick.edge, 2),
+        round(pick.probability_over, 3),
+        pick.recommendation,
+        pick.confidence,
+        pick.raw_player,
+    )
+
+
+def _build_messages_from_fingerprint(fingerprint: Tuple[Any, ...]) -> List[Dict[str, str]]:
     """
-    player = pick.raw_player
+    Build the base messages for explaining a single pick from its fingerprint
+    (see _pick_fingerprint).
+    """
+    (
+        handle,
+        team,
+        role,
+        stat_type,
+        line_value,
+        projected_value,
+        edge,
+        probability_over,
+        recommendation,
+        confidence,
+        player,
+    ) = fingerprint
     context_block = _format_player_context(player)
 
     pick_summary = f"""
-    Player: {pick.player_handle}
-    Team: {pick.team_name}
-    Role: {pick.role}
-    Region (if present): {player.get('region', 'unknown')}
-    Stat type: {pick.stat_type}
-    Line: {pick.line_value:.1f}
-    Projection: {pick.projected_value:.1f}
-    Edge: {pick.edge:.2f}
-    P(Over): {pick.probability_over * 100:.1f}%
-    Recommendation: {pick.recommendation} ({pick.confidence} confidence)
+    Player: {handle}
+    Team: {team}
+    Role: {role}
+    Region (if present): {getattr(player, 'region', 'unknown')}
+    Stat type: {stat_type}
+    Line: {line_value:.1f}
+    Projection: {projected_value:.1f}
+    Edge: {edge:.2f}
+    P(Over): {probability_over * 100:.1f}%
+    Recommendation: {recommendation} ({confidence} confidence)
     """.strip()
 
     user_content = f"""
@@ -76,20 +168,91 @@ def _build_initial_messages(pick: Any) -> List[Dict[str, str]]:
     ]
 
 
-def generate_initial_explanation(pick: Any) -> str:
+def _build_initial_messages(pick: Any) -> List[Dict[str, str]]:
+    """
+    Build the base messages for explaining a single pick.
+    Assumes pick is a PickResult from engine.pick_engine.
+    """
+    return _build_messages_from_fingerprint(_pick_fingerprint(pick))
+
+
+def generate_initial_explanation(client: OpenAI, pick: Any) -> str:
     """
     Call ChatGPT once to generate the main pick explanation.
+
+    Results are cached per pick fingerprint for up to an hour (in a bounded
+    LRU), so the same pick (same player, line and numbers) doesn't cost a
+    second API call while it is still cached. Empty completions are not cached.
     """
-    messages = _build_initial_messages(pick)
+    fingerprint = _pick_fingerprint(pick)
+    cached = _cache_get(fingerprint)
+    if cached is not None:
+        return cached
+
+    messages = _build_messages_from_fingerprint(fingerprint)
     completion = client.chat.completions.create(
         model="gpt-4.1-mini",  # or another model you have access to
         messages=messages,
         temperature=0.3,
     )
-    return completion.choices[0].message.content
+    explanation = completion.choices[0].message.content or ""
+    _cache_put(fingerprint, explanation)
+    return explanation
+
+
+def stream_initial_explanation(client: OpenAI, pick: Any) -> Iterator[str]:
+    """
+    Streaming version of generate_initial_explanation: yields the explanation
+    text chunk by chunk as the model produces it, so the UI can show the first
+    words right away instead of waiting for the whole completion.
+
+    Shares the same cache: a cached pick yields its full text at once, and a
+    freshly streamed one is stored once the stream finishes (unless empty).
+    """
+    fingerprint = _pick_fingerprint(pick)
+    cached = _cache_get(fingerprint)
+    if cached is not None:
+        yield cached
+        return
+
+    messages = _build_messages_from_fingerprint(fingerprint)
+    stream = client.chat.completions.create(
+        model="gpt-4.1-mini",  # or another model you have access to
+        messages=messages,
+        temperature=0.3,
+        stream=True,
+    )
+    parts: List[str] = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        text = chunk.choices[0].delta.content or ""
+        if text:
+            parts.append(text)
+            yield text
+
+    _cache_put(fingerprint, "".join(parts))
+
+
+def generate_explanations_bulk(
+    client: OpenAI, picks: List[Any], max_workers: int = 8
+) -> List[str]:
+    """
+    Generate initial explanations for many picks at once.
+
+    Each call is independent and mostly waiting on the network, so we run them
+    on a small thread pool: N explanations take about as long as the slowest
+    one instead of N round-trips back to back. Cached picks return instantly.
+
+    Returns explanations in the same order as `picks`.
+    """
+    if not picks:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(generate_initial_explanation, client), picks))
 
 
-def answer_followup(pick: Any, history: List[Dict[str, str]]) -> str:
+def answer_followup(client: OpenAI, pick: Any, history: List[Dict[str, str]]) -> str:
     """
     Answer a follow-up question about this pick.
     `history` is a list of {"role": "user"|"assistant", "content": "..."}.
@@ -10,17 +10,21 @@ This module contains the "model" logic:
 - Generate a plain-English explanation per pick.
 """
 
-import math
-from dataclasses import dataclass
-from typing import Literal, Dict, Any, List
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from typing import Literal, Dict, List, Optional, Tuple
 
-from data.vlrgg_client import fetch_vlr_stats, build_players_from_stats
+import numpy as np
+
+from data.vlrgg_client import Player, fetch_vlr_segments, build_players_from_stats
 
 # Type alias for risk modes
 RiskMode = Literal["safe", "standard", "yolo"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PickResult:
     """
     Represents one "pick" for a single player/stat combination.
@@ -31,11 +35,19 @@ class PickResult:
         - Line: 21.5
         - Our projection: 23.0
         - Edge, probability, recommendation, etc.
+
+    The plain-English `explanation` is built lazily on first access (most
+    picks are never read in full), then kept on the instance.
+
+    Instances are slotted and frozen: no per-instance __dict__, and hashable
+    (by their pick fields; the raw_player record is left out of eq/hash,
+    player_id already identifies the player).
+
+    `raw_player` is the shared Player from build_players_from_stats (the
+    kills and assists picks of a player point at the same one, never a copy);
+    handle / team / role are read straight from it instead of stored again.
     """
     player_id: str
-    player_handle: str
-    team_name: str
-    role: str
     stat_type: str       # "kills" or "assists"
     line_value: float
     projected_value: float
@@ -43,19 +55,96 @@ class PickResult:
     probability_over: float
     recommendation: str  # "Lean Over", "Lean Under", "Stay Away"
     confidence: str      # "Low", "Medium", "High"
-    explanation: str
-    raw_player: Dict[str, Any]   # <— NEW
+    risk_mode: RiskMode  # risk profile the recommendation was made under
+    raw_player: Player = field(compare=False)   # <— NEW
+    _explanation: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def player_handle(self) -> str:
+        """In-game name (from raw_player)."""
+        return self.raw_player.handle
+
+    @property
+    def team_name(self) -> str:
+        """Team / org tag (from raw_player)."""
+        return self.raw_player.team
+
+    @property
+    def role(self) -> str:
+        """Inferred role (from raw_player)."""
+        return self.raw_player.role
+
+    @property
+    def explanation(self) -> str:
+        """Plain-English explanation of the pick (generated on first access)."""
+        if self._explanation is None:
+            text = _explain_pick(
+                player=self.raw_player,
+                stat_type=self.stat_type,
+                line_value=self.line_value,
+                projection=self.projected_value,
+                edge=self.edge,
+                probability_over=self.probability_over,
+                recommendation=self.recommendation,
+                risk_mode=self.risk_mode,
+            )
+            # Frozen dataclass: memoize through object.__setattr__
+            object.__setattr__(self, "_explanation", text)
+        return self._explanation
 
 
 # ---------- Projection logic ----------
+#
+# The math below works on whole NumPy arrays (one entry per player) rather than
+# one player at a time: build_picks turns the players list into a
+# "structure of arrays" once, and _score_kernel runs every step below as a
+# handful of vectorized operations instead of a Python call per player.
+
+
+# Per-player stats the projection math needs, as float columns
+_NUMERIC_FIELDS = ("kills_per_map", "assists_per_map", "rating", "kast", "consistency")
+_NUMERIC_GETTER = attrgetter(*_NUMERIC_FIELDS)
+
+
+def _players_to_arrays(players: List[Player]) -> Dict[str, np.ndarray]:
+    """
+    Convert the list of players into one float array per stat
+    (structure of arrays), aligned with the order of `players`.
+
+    Each player is read once (a single attrgetter call fetches all of its
+    numeric fields), then the (N, fields) table is split into columns.
+    """
+    table = np.array(
+        [_NUMERIC_GETTER(player) for player in players], dtype=np.float64
+    ).reshape(-1, len(_NUMERIC_FIELDS))
+    return {name: table[:, j] for j, name in enumerate(_NUMERIC_FIELDS)}
+
+
+# Both stat types are scored together as stacked (2, N) arrays: row 0 is
+# kills, row 1 is assists. The per-stat constants below are (2, 1) columns,
+# so they broadcast across every player in their row.
+_STAT_TYPES = ("kills", "assists")
+
+# Projection sensitivity to rating / KAST deviations
+# (kills lean heavier on both; assists are slightly less sensitive)
+_RATING_COEF = np.array([[4.0], [2.5]])
+_KAST_COEF = np.array([[10.0], [6.0]])
+
+# Half-point offset from the rounded base to the synthetic line
+# (kills sit half a point above, assists half a point below)
+_LINE_OFFSET = np.array([[0.5], [-0.5]])
 
+# Base spread in stat units: typical kill variation vs. lower-variance assists
+_BASE_SPREAD = np.array([[3.0], [2.0]])
 
-def _projection_for_stat(player: Dict[str, Any], stat_type: str) -> float:
+
+def _projection(base: np.ndarray, dr: np.ndarray, dk: np.ndarray) -> np.ndarray:
     """
-    Compute our projected per-map stat (kills or assists) for a player.
+    Compute our projected per-map kills and assists for every player.
 
     We start from:
-      - kills_per_map or assists_per_map (from data.vlrgg_client)
+      - kills_per_map / assists_per_map (from data.vlrgg_client), stacked
+        into `base`
     Then apply small adjustments based on:
       - rating (how strong the player is overall)
       - KAST (consistency / impact)
@@ -63,36 +152,18 @@ def _projection_for_stat(player: Dict[str, Any], stat_type: str) -> float:
     Math concept:
       projection = base + a*(rating - baseline_rating) + b*(KAST - baseline_kast)
 
+    with a / b taken per stat from _RATING_COEF / _KAST_COEF.
+    `dr` / `dk` are those rating / KAST deviations (see _score_kernel).
     """
-    base_kills = player["kills_per_map"]
-    base_assists = player["assists_per_map"]
-    rating = player["rating"]
-    kast = player["kast"]
-
-    # Baseline values that represent an "average" player
-    baseline_rating = 1.0
-    baseline_kast = 0.72
-
-    # Deviations from the baseline
-    dr = rating - baseline_rating        # how much better/worse than avg rating
-    dk = kast - baseline_kast           # how much better/worse than avg KAST
-
-    if stat_type == "kills":
-        base = base_kills
-        # Heavier weight on KAST and rating for kills
-        proj = base + 4.0 * dr + 10.0 * dk
-    else:  # assists
-        base = base_assists
-        # Assists might be slightly less sensitive to rating/KAST
-        proj = base + 2.5 * dr + 6.0 * dk
+    proj = base + _RATING_COEF * dr + _KAST_COEF * dk
 
     # Projection cannot be negative
-    return max(0.0, proj)
+    return np.maximum(0.0, proj)
 
 
-def _line_for_stat(player: Dict[str, Any], stat_type: str) -> float:
+def _line(base: np.ndarray) -> np.ndarray:
     """
-    Synthesize a PrizePicks-style line for a given stat.
+    Synthesize PrizePicks-style lines for kills and assists, for every player.
 
     In a real integration, you'd pull actual lines from a provider.
     For the hackathon, we fake lines from the base per-map stats.
@@ -101,46 +172,34 @@ def _line_for_stat(player: Dict[str, Any], stat_type: str) -> float:
       - If kills_per_map ≈ 21.3, we might set line_kills = 21.5
       - For assists, we keep lines smaller and non-zero.
     """
-    if stat_type == "kills":
-        base = player["kills_per_map"]
-        # Round kills to the nearest integer, then add 0.5 to get a half-point line
-        return round(base) + 0.5
-    else:
-        base = player["assists_per_map"]
-        val = round(base)
-        # Ensure at least 0.5 so we never show a 0.0 line
-        return max(0.5, val - 0.5)
+    # Round to the nearest integer (halves round up, via floor(x + 0.5), rather
+    # than np.round's half-to-even), then move to the half point.
+    # Ensure at least 0.5 so we never show a 0.0 line (only assists can get there).
+    return np.maximum(0.5, np.floor(base + 0.5) + _LINE_OFFSET)
 
 
-def _spread_for_stat(player: Dict[str, Any], stat_type: str) -> float:
+def _spread(shrink: np.ndarray) -> np.ndarray:
     """
     Define the "spread" (uncertainty) in stat units for our edge calculation.
 
     Idea:
       edge ≈ (projection - line) / spread   (like a z-score)
 
-    - Base spread is larger for kills than assists.
+    - Base spread is larger for kills than assists (_BASE_SPREAD).
     - If the player is more "consistent", we slightly shrink the spread
-      (we trust their mean more).
+      (we trust their mean more). `shrink` is that factor, 1 - 0.3*consistency,
+      which shrinks the spread by up to ~30% for highly consistent players.
     """
-    cons = player["consistency"]  # 0–1 consistency score
-
-    if stat_type == "kills":
-        base = 3.0   # typical kill variation
-    else:
-        base = 2.0   # assists are usually lower-variance
-
-    # shrink spread by up to ~30% for highly consistent players
-    adj = base * (1.0 - 0.3 * cons)
+    adj = _BASE_SPREAD * shrink
 
     # spread should never be too small
-    return max(0.5, adj)
+    return np.maximum(0.5, adj)
 
 
 # ---------- Edge & probability ----------
 
 
-def _edge_score(projection: float, line_value: float, spread: float) -> float:
+def _edge_score(projection: np.ndarray, line_value: np.ndarray, spread: np.ndarray) -> np.ndarray:
     """
     Compute the edge as a rough "z-score":
         edge = (projection - line) / spread
@@ -149,80 +208,248 @@ def _edge_score(projection: float, line_value: float, spread: float) -> float:
     - Negative edge -> projection below the line (Under side).
     - Magnitude |edge| indicates strength.
     """
-    if spread <= 0:
-        spread = 0.5
+    spread = np.where(spread <= 0, 0.5, spread)
     return (projection - line_value) / spread
 
 
-def _edge_to_probability_over(edge: float) -> float:
+# Hart's double-precision rational approximation to the normal CDF, as
+# written up by West ("Better approximations to cumulative normal functions").
+# Coefficients are listed highest power first, for np.polyval.
+_HART_NUM = np.array([
+    3.52624965998911e-02,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+    220.206867912376,
+])
+_HART_DEN = np.array([
+    8.83883476483184e-02,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+    440.413735824752,
+])
+
+# Loop-invariant constants for _cumnorm, so the array passes only multiply:
+# the |z| below which the rational form is used (10 / sqrt(2)), and
+# 1 / sqrt(2π) for the continued-fraction tail.
+_HART_CUTOFF = 7.07106781186547
+_INV_SQRT_2PI = 1.0 / 2.506628274631
+
+
+def _cumnorm(z: np.ndarray) -> np.ndarray:
+    """
+    Normal CDF Φ(z) for a whole array, via the Hart/West "Cumnorm" routine:
+
+      - |z| < 7.07: ratio of two Horner-evaluated polynomials times exp(-z²/2)
+      - 7.07 <= |z| <= 37: a short continued fraction
+      - |z| > 37: the tail is exactly 0 (or 1) in double precision
+
+    Accurate to ~1e-14, which is far beyond what the 1%–99% clip needs, and
+    it's plain array arithmetic with no special-function library call.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    xabs = np.abs(z)
+    exponential = np.exp(-0.5 * xabs * xabs)
+
+    # Central region: rational polynomial approximation
+    central = exponential * np.polyval(_HART_NUM, xabs) / np.polyval(_HART_DEN, xabs)
+
+    # Outer region: continued fraction
+    build = xabs + 0.65
+    build = xabs + 4.0 / build
+    build = xabs + 3.0 / build
+    build = xabs + 2.0 / build
+    build = xabs + 1.0 / build
+    tail = exponential / build * _INV_SQRT_2PI
+
+    # Lower-tail probability Φ(-|z|), then flip for positive z
+    lower = np.where(xabs < _HART_CUTOFF, central, tail)
+    lower = np.where(xabs > 37.0, 0.0, lower)
+    return np.where(z > 0, 1.0 - lower, lower)
+
+
+def _edge_to_probability_over(edge: np.ndarray) -> np.ndarray:
     """
     Convert the edge (treated as a z-score) into a probability that
     the player goes Over the line, using the normal CDF.
 
     Φ(z) = 0.5 * (1 + erf(z / sqrt(2)))
 
+    evaluated with the rational approximation in _cumnorm over the whole array.
+
     We clip the result to [1%, 99%] to avoid extreme 0%/100% claims.
     """
-    z = edge
-    prob = 0.5 * (1.0 + math.erf(z / math.sqrt(2)))
-    return max(0.01, min(0.99, prob))
+    return np.clip(_cumnorm(edge), 0.01, 0.99)
 
 
-# ---------- Recommendation & confidence ----------
+# ---------- Scoring kernel ----------
 
 
-def _recommendation_from_edge(edge: float, risk_mode: RiskMode, stat_type: str) -> str:
+def _score_kernel(
+    kills_per_map: np.ndarray,
+    assists_per_map: np.ndarray,
+    rating: np.ndarray,
+    kast: np.ndarray,
+    consistency: np.ndarray,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
     """
-    Turn an edge value into an Over/Under/Stay Away recommendation, based on:
+    Run the whole scoring chain for every player and both stat types:
+
+        projection -> line -> spread -> edge -> P(Over)
 
-      - risk_mode:
-          "safe"     -> only strong edges become picks
-          "standard" -> medium thresholds
-          "yolo"     -> more aggressive, lower thresholds
+    Inputs are aligned float arrays (one entry per player). Kills and assists
+    are stacked into one (2, N) array, so each step is a single broadcasted
+    expression over both stats; the pieces they share (rating / KAST
+    deviations, the consistency shrink) are computed once.
 
-      - stat_type:
-          kills edges might require slightly higher thresholds than assists.
+    Returns {stat_type: (projection, line_value, edge, prob_over)}, each a
+    row of the stacked results.
     """
-    # Thresholds by risk mode and stat type
-    if risk_mode == "safe":
-        thr_kills, thr_assists = 1.0, 0.9
-    elif risk_mode == "standard":
-        thr_kills, thr_assists = 0.7, 0.6
-    else:  # "yolo"
-        thr_kills, thr_assists = 0.4, 0.35
+    # Baseline values that represent an "average" player
+    baseline_rating = 1.0
+    baseline_kast = 0.72
+
+    # Deviations from the baseline
+    dr = rating - baseline_rating        # how much better/worse than avg rating
+    dk = kast - baseline_kast           # how much better/worse than avg KAST
+
+    # Consistency-based spread factor (0–1 consistency score)
+    shrink = 1.0 - 0.3 * consistency
 
-    thr = thr_kills if stat_type == "kills" else thr_assists
+    # Row 0 = kills, row 1 = assists (see _STAT_TYPES)
+    base = np.stack([kills_per_map, assists_per_map])
+
+    # Compute our projection
+    projection = _projection(base, dr, dk)
+
+    # Make up a PrizePicks-like line for each stat
+    line_value = _line(base)
+
+    # Estimate uncertainty
+    spread = _spread(shrink)
+
+    # Compute edge (z-score-ish)
+    edge = _edge_score(projection, line_value, spread)
+
+    # Convert edge to P(Over) using normal approximation
+    prob_over = _edge_to_probability_over(edge)
+
+    return {
+        stat_type: (projection[row], line_value[row], edge[row], prob_over[row])
+        for row, stat_type in enumerate(_STAT_TYPES)
+    }
+
+
+# ---------- Recommendation & confidence ----------
+
+
+# Over/Under edge thresholds, looked up once per _apply_risk call:
+#   - risk_mode:
+#       "safe"     -> only strong edges become picks
+#       "standard" -> medium thresholds
+#       "yolo"     -> more aggressive, lower thresholds
+#   - stat_type:
+#       kills edges require slightly higher thresholds than assists.
+_THRESHOLDS: Dict[str, Dict[str, float]] = {
+    "safe": {"kills": 1.0, "assists": 0.9},
+    "standard": {"kills": 0.7, "assists": 0.6},
+    "yolo": {"kills": 0.4, "assists": 0.35},
+}
+_REC_LABELS = np.array(["Lean Over", "Lean Under", "Stay Away"])
+
+# |edge| cutoffs between Low / Medium / High confidence
+_CONF_EDGES = np.array([0.8, 1.5])
+_CONF_LABELS = np.array(["Low", "Medium", "High"])
+
+
+def _recommendation_from_edge(edge: np.ndarray, mag: np.ndarray, thr: float) -> np.ndarray:
+    """
+    Turn edge values into Over/Under/Stay Away recommendations, given the
+    threshold `thr` for this risk mode and stat type (from _THRESHOLDS).
+    `mag` is |edge|, computed once upstream and shared with confidence and
+    sorting.
 
-    if edge >= thr:
-        return "Lean Over"
-    if edge <= -thr:
-        return "Lean Under"
-    return "Stay Away"
+    Works on a whole edge array at once: each edge is bucketed into an index
+    (0 = Over, 1 = Under, 2 = Stay Away) that picks its label.
+    """
+    strong = mag >= thr
+    rec_idx = np.where(strong, np.where(edge < 0, 1, 0), 2)
+    return _REC_LABELS[rec_idx]
 
 
-def _confidence_from_edge(edge: float) -> str:
+def _confidence_from_mag(mag: np.ndarray) -> np.ndarray:
     """
-    Map the magnitude of edge to a qualitative confidence level.
+    Map the magnitude of each edge (`mag` = |edge|) to a qualitative
+    confidence level.
 
     - High:  |edge| >= 1.5
     - Medium:0.8 <= |edge| < 1.5
     - Low:   |edge| < 0.8
 
     These cutoffs are arbitrary but easy to explain: bigger edge => more confident.
+    Bucketing is a single np.searchsorted over the sorted cutoffs.
     """
-    mag = abs(edge)
-    if mag >= 1.5:
-        return "High"
-    if mag >= 0.8:
-        return "Medium"
-    return "Low"
+    conf_idx = np.searchsorted(_CONF_EDGES, mag, side="right")
+    return _CONF_LABELS[conf_idx]
 
 
 # ---------- Explanation text ----------
+#
+# Everything that depends only on (recommendation, risk_mode) is baked into one
+# template per combination at import time; _explain_pick just fills in the numbers.
+
+_RISK_LABELS: Dict[str, str] = {
+    "safe": "conservative",
+    "standard": "balanced",
+    "yolo": "aggressive",
+}
+
+# Base description about averages and projection, then
+# rating/KAST-based consistency context
+_BASE_TEMPLATE = (
+    "{handle} ({team} {role}) averages about "
+    "{base_val:.1f} {stat_type} per map over ~{maps} maps in this window. "
+    "Our projection for this slate is {projection:.1f} {stat_type}, "
+    "against a line of {line_value:.1f}, leaning {direction} by "
+    "{gap:.1f}."
+    " Their rating is {rating:.2f} with KAST {kast:.2f}, "
+    "suggesting {consistency_text}."
+)
+
+# Probability text, based on whether we lean Over or Under
+# ({pct} / {under_pct} are whole percentages, see _explain_pick)
+_Z_SCORE_PREFIX = " Interpreting the edge as a rough z-score, this "
+_PROB_TEMPLATES: Dict[str, str] = {
+    "Lean Over": _Z_SCORE_PREFIX + "corresponds to about {pct}% chance to go over the line.",
+    "Lean Under": _Z_SCORE_PREFIX + "implies about {under_pct}% chance to stay under.",
+    "Stay Away": (
+        " The edge is small in either direction, so this looks close to a coin flip "
+        "under our assumptions."
+    ),
+}
+
+# Full template per (recommendation, risk_mode), ending with the closing
+# sentence tying it to the chosen risk profile
+_TEMPLATES: Dict[Tuple[str, str], str] = {
+    (recommendation, risk_mode): "".join((
+        _BASE_TEMPLATE,
+        prob_template,
+        f" Under a **{risk_label}** risk profile, we categorize this as "
+        f"**{recommendation}**, with an edge of {{edge:.2f}} and that implied probability.",
+    ))
+    for recommendation, prob_template in _PROB_TEMPLATES.items()
+    for risk_mode, risk_label in _RISK_LABELS.items()
+}
 
 
 def _explain_pick(
-    player: Dict[str, Any],
+    player: Player,
     stat_type: str,
     line_value: float,
     projection: float,
@@ -241,137 +468,315 @@ def _explain_pick(
       - how far projection is from line
       - approximate probability of Over or Under
       - risk mode used (Safe/Standard/YOLO)
+
+    Every number is quantized to the precision the text shows it at (the
+    exact-value decisions, like over/under and high/low consistency, are made
+    first), and the text itself comes from _explain_cached. Picks that read
+    the same, e.g. the same player across risk modes or reruns, share one
+    cached string.
     """
-    maps = player["maps_played"]
-    rating = player["rating"]
-    kast = player["kast"]
-    base_val = player["kills_per_map"] if stat_type == "kills" else player["assists_per_map"]
-
-    direction = "over" if projection > line_value else "under"
-    risk_label = {"safe": "conservative", "standard": "balanced", "yolo": "aggressive"}[risk_mode]
-
-    # Base description about averages and projection
-    base = (
-        f"{player['handle']} ({player['team']} {player['role']}) averages about "
-        f"{base_val:.1f} {stat_type} per map over ~{maps} maps in this window. "
-        f"Our projection for this slate is {projection:.1f} {stat_type}, "
-        f"against a line of {line_value:.1f}, leaning {direction} by "
-        f"{abs(projection - line_value):.1f}."
+    kast = player.kast
+    # Whole-percent P(Over), computed once; Under is its complement
+    pct = int(round(probability_over * 100.0))
+    base_val = player.kills_per_map if stat_type == "kills" else player.assists_per_map
+
+    return _explain_cached(
+        player.handle,
+        player.team,
+        player.role,
+        stat_type,
+        player.maps_played,
+        round(base_val, 1),
+        round(projection, 1),
+        round(line_value, 1),
+        "over" if projection > line_value else "under",
+        round(abs(projection - line_value), 1),
+        round(player.rating, 2),
+        round(kast, 2),
+        "high consistency" if kast >= 0.78 else "some volatility",
+        pct,
+        round(edge, 2),
+        recommendation,
+        risk_mode,
     )
 
-    # Rating/KAST-based consistency context
-    context = (
-        f" Their rating is {rating:.2f} with KAST {kast:.2f}, "
-        f"suggesting {'high consistency' if kast >= 0.78 else 'some volatility'}."
+
+@lru_cache(maxsize=4096)
+def _explain_cached(
+    handle: str,
+    team: str,
+    role: str,
+    stat_type: str,
+    maps: int,
+    base_q: float,
+    projection_q: float,
+    line_q: float,
+    direction: str,
+    gap_q: float,
+    rating_q: float,
+    kast_q: float,
+    consistency_text: str,
+    pct: int,
+    edge_q: float,
+    recommendation: str,
+    risk_mode: RiskMode,
+) -> str:
+    """
+    Fill in the explanation template from already-quantized, displayed values
+    (see _explain_pick). The output depends on nothing else, so it is safe to
+    memoize on them.
+    """
+    return _TEMPLATES[(recommendation, risk_mode)].format(
+        handle=handle,
+        team=team,
+        role=role,
+        base_val=base_q,
+        stat_type=stat_type,
+        maps=maps,
+        projection=projection_q,
+        line_value=line_q,
+        direction=direction,
+        gap=gap_q,
+        rating=rating_q,
+        kast=kast_q,
+        consistency_text=consistency_text,
+        pct=pct,
+        under_pct=100 - pct,
+        edge=edge_q,
     )
 
-    # Probability text, based on whether we lean Over or Under
-    prob_over_pct = probability_over * 100.0
-    if recommendation == "Lean Over":
-        prob_text = (
-            f" Interpreting the edge as a rough z-score, this corresponds to about "
-            f"{prob_over_pct:.0f}% chance to go over the line."
-        )
-    elif recommendation == "Lean Under":
-        prob_text = (
-            f" Interpreting the edge as a rough z-score, this implies about "
-            f"{(100 - prob_over_pct):.0f}% chance to stay under."
-        )
-    else:
-        prob_text = (
-            " The edge is small in either direction, so this looks close to a coin flip "
-            "under our assumptions."
-        )
 
-    # Closing sentence tying it to the chosen risk profile
-    rec_text = (
-        f" Under a **{risk_label}** risk profile, we categorize this as "
-        f"**{recommendation}**, with an edge of {edge:.2f} and that implied probability."
-    )
+# ---------- Cached pipeline stages ----------
+
+# How long fetched stats (and everything derived from them) are reused before
+# build_picks pulls fresh numbers from vlrggapi.
+CACHE_TTL_SECONDS = 300
 
-    return base + context + prob_text + rec_text
 
+def cache_bucket() -> int:
+    """
+    Index of the current CACHE_TTL_SECONDS window. The cached stages below are
+    keyed on it, so they refetch when the window rolls over. Callers that put
+    their own cache in front of build_picks (like the Streamlit app) should key
+    on it too, so both layers expire together.
+    """
+    return int(time.time() // CACHE_TTL_SECONDS)
 
-# ---------- Public function: build_picks ----------
 
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    """Mark a cached array read-only so no caller can mutate shared state."""
+    arr.flags.writeable = False
+    return arr
 
-def build_picks(region: str, timespan: str, risk_mode: RiskMode) -> List[PickResult]:
+
+@lru_cache(maxsize=16)
+def _fetch_and_project(
+    region: str, timespan: str, ttl_bucket: int
+) -> Tuple[Tuple[Player, ...], Dict[str, Tuple[np.ndarray, ...]]]:
     """
-    Main entry point for the UI:
+    Risk-independent stage of build_picks, cached per (region, timespan).
 
-    1. Fetch stats via vlrggapi (through fetch_vlr_stats).
-    2. Build clean player structures.
-    3. For each player and each stat (kills, assists):
-       - compute projection
-       - synthesize line
-       - compute spread, edge, and probability
-       - derive recommendation + confidence
-       - generate explanation
-    4. Return a list of PickResult objects, sorted by absolute edge (biggest first).
+    Fetches stats, builds players, and computes projection / line / edge /
+    P(Over) arrays plus confidence labels for each stat type. None of this
+    depends on risk mode, so switching Safe/Standard/YOLO reuses it and only
+    the recommendation thresholds are re-applied (see _apply_risk).
+
+    `ttl_bucket` is the current CACHE_TTL_SECONDS window (cache_bucket()); it
+    changes when the window rolls over, which makes the next call refetch.
+
+    Returns (players, per_stat) where per_stat[stat_type] is a tuple of
+    read-only arrays (projection, line_value, edge, |edge|, prob_over,
+    confidence),
+    aligned with `players`.
+    """
+    # 1) Pull raw per-player stat records from vlrggapi
+    segments = fetch_vlr_segments(region=region, timespan=timespan)
+
+    # 2) Convert the raw records into structured Player records
+    players = tuple(build_players_from_stats(segments))
+
+    # 3) Compute projection -> line -> spread -> edge -> probability for all
+    #    players and both stat types in one kernel call
+    cols = _players_to_arrays(list(players))
+    per_stat = {}
+    for stat_type, (projection, line_value, edge, prob_over) in _score_kernel(**cols).items():
+        # |edge| is taken once here and reused for confidence, recommendation
+        # and sorting. High/Medium/Low confidence only depends on it, so it
+        # lives here too.
+        mag = np.abs(edge)
+        conf = _confidence_from_mag(mag)
+        per_stat[stat_type] = tuple(
+            _read_only(arr) for arr in (projection, line_value, edge, mag, prob_over, conf)
+        )
+
+    return players, per_stat
+
+
+def _player_major(arrays: List[np.ndarray]) -> np.ndarray:
+    """
+    Interleave aligned per-stat arrays (one per entry of _STAT_TYPES) into one
+    flat array in player-major order: player 0 kills, player 0 assists,
+    player 1 kills, ... Flat index i is player i // 2, stat _STAT_TYPES[i % 2].
     """
-    # 1) Pull raw stats from vlrggapi and turn into a DataFrame
-    df = fetch_vlr_stats(region=region, timespan=timespan)
+    return np.column_stack(arrays).ravel()
 
-    # 2) Convert DataFrame rows into structured player dictionaries
-    players = build_players_from_stats(df)
 
+@lru_cache(maxsize=48)
+def _apply_risk(
+    region: str,
+    timespan: str,
+    risk_mode: RiskMode,
+    min_mag: float,
+    k: Optional[int],
+    ttl_bucket: int,
+) -> Tuple[PickResult, ...]:
+    """
+    Risk-dependent stage of build_picks / build_top_picks, cached per
+    (region, timespan, risk_mode, min_mag, k).
+
+    Takes the cached projections and derives the recommendation for every
+    player/stat, then builds PickResults only for those with |edge| >= min_mag
+    (and, if `k` is given, only the k largest of those), sorted by |edge|.
+    Explanations are left to PickResult.explanation, which builds them on
+    first access.
+    """
+    players, per_stat = _fetch_and_project(region, timespan, ttl_bucket)
+    thresholds = _THRESHOLDS[risk_mode]
+
+    # One flat, player-major array per field (see _player_major)
+    projection = _player_major([per_stat[s][0] for s in _STAT_TYPES])
+    line_value = _player_major([per_stat[s][1] for s in _STAT_TYPES])
+    edge = _player_major([per_stat[s][2] for s in _STAT_TYPES])
+    mag = _player_major([per_stat[s][3] for s in _STAT_TYPES])
+    prob_over = _player_major([per_stat[s][4] for s in _STAT_TYPES])
+    conf = _player_major([per_stat[s][5] for s in _STAT_TYPES])
+
+    # Turn edges into Over/Under/Stay Away depending on risk mode,
+    # for all players at once
+    rec = _player_major([
+        _recommendation_from_edge(per_stat[s][2], per_stat[s][3], thresholds[s])
+        for s in _STAT_TYPES
+    ])
+
+    # 4) Drop near-zero edges (always Stay Away), then sort the rest by
+    #    absolute edge (largest edges at the top). The stable argsort keeps
+    #    ties in player-major order.
+    keep = np.flatnonzero(mag >= min_mag)
+    if k is not None and k < len(keep):
+        # Top-K only: np.partition finds the k-th largest |edge| in O(N). Every
+        # pick at least that large is kept, including all ties with it (keep
+        # stays in index order), so the stable sort + slice below picks the
+        # same k as the full sort would. Only those k become PickResults.
+        if k <= 0:
+            keep = keep[:0]
+        else:
+            kth_mag = -np.partition(-mag[keep], k - 1)[k - 1]
+            keep = keep[mag[keep] >= kth_mag]
+    order = keep[np.argsort(-mag[keep], kind="stable")][:k]
+
+    n_stats = len(_STAT_TYPES)
     picks: List[PickResult] = []
 
-    # 3) Iterate through each player and each stat type we care about
-    for player in players:
-        for stat_type in ("kills", "assists"):
-            # Compute our projection
-            projection = _projection_for_stat(player, stat_type)
+    # Materialize one PickResult per kept player/stat (as plain Python values)
+    for i, proj, line, edge_value, prob, rec_label, conf_label in zip(
+        order.tolist(),
+        projection[order].tolist(),
+        line_value[order].tolist(),
+        edge[order].tolist(),
+        prob_over[order].tolist(),
+        rec[order].tolist(),
+        conf[order].tolist(),
+    ):
+        player = players[i // n_stats]
+        picks.append(
+            PickResult(
+                player_id=player.id,
+                stat_type=_STAT_TYPES[i % n_stats],
+                line_value=line,
+                projected_value=proj,
+                edge=edge_value,
+                probability_over=prob,
+                recommendation=rec_label,
+                confidence=conf_label,
+                risk_mode=risk_mode,
+                raw_player=player,         # <— NEW: full stats record to feed ChatGPT
+            )
+        )
+
+    return tuple(picks)
+
 
-            # Make up a PrizePicks-like line for this stat
-            line_value = _line_for_stat(player, stat_type)
+def clear_cache() -> None:
+    """
+    Drop all cached stats, projections and picks, so the next build_picks
+    call refetches from vlrggapi (e.g. behind a "Refresh stats" button).
+    """
+    _apply_risk.cache_clear()
+    _fetch_and_project.cache_clear()
 
-            # Estimate uncertainty
-            spread = _spread_for_stat(player, stat_type)
 
-            # Compute edge (z-score-ish)
-            edge = _edge_score(projection, line_value, spread)
+# ---------- Public functions: build_top_picks / build_picks ----------
 
-            # Convert edge to P(Over) using normal approximation
-            prob_over = _edge_to_probability_over(edge)
 
-            # Turn edge into Over/Under/Stay Away depending on risk mode
-            rec = _recommendation_from_edge(edge, risk_mode, stat_type)
+def build_top_picks(
+    region: str,
+    timespan: str,
+    risk_mode: RiskMode,
+    k: Optional[int],
+    min_mag: float = 0.2,
+) -> List[PickResult]:
+    """
+    Like build_picks, but only returns the `k` picks with the largest |edge|
+    (all of them if k is None), biggest first. For any k >= 0 the result is
+    exactly build_picks(region, timespan, risk_mode, min_mag)[:k], ties included.
 
-            # Determine High/Medium/Low confidence
-            conf = _confidence_from_edge(edge)
+    Edges for every player/stat are cheap arrays; the top k are selected with
+    np.partition before any PickResult is built, so a top-K view only pays
+    for k objects. Cached per (region, timespan, risk_mode, min_mag, k), like
+    build_picks.
 
-            # Generate natural-language explanation
-            explanation = _explain_pick(
-                player=player,
-                stat_type=stat_type,
-                line_value=line_value,
-                projection=projection,
-                edge=edge,
-                probability_over=prob_over,
-                recommendation=rec,
-                risk_mode=risk_mode,
-            )
+    Raises ValueError if k is negative.
+    """
+    if k is not None and k < 0:
+        raise ValueError(f"k must be non-negative or None, got {k}")
+    return list(_apply_risk(region, timespan, risk_mode, min_mag, k, cache_bucket()))
 
-            # Build the PickResult dataclass instance
-            picks.append(
-                PickResult(
-                    player_id=player["id"],
-                    player_handle=player["handle"],
-                    team_name=player["team"],
-                    role=player["role"],
-                    stat_type=stat_type,
-                    line_value=line_value,
-                    projected_value=projection,
-                    edge=edge,
-                    probability_over=prob_over,
-                    recommendation=rec,
-                    confidence=conf,
-                    explanation=explanation,
-                    raw_player=player,         # <— NEW: full stats dict to feed ChatGPT
-                )
-            )
 
-    # 4) Sort picks by absolute edge (largest edges at the top)
-    picks.sort(key=lambda p: abs(p.edge), reverse=True)
-    return picks
+def load_players(region: str, timespan: str) -> List[Player]:
+    """
+    Every player the engine built for (region, timespan), whether or not any of
+    their picks survive build_picks' min_mag cutoff. Shares the cached
+    fetch/projection stage, so after build_picks this is a lookup.
+    """
+    players, _ = _fetch_and_project(region, timespan, cache_bucket())
+    return list(players)
+
+
+def build_picks(
+    region: str, timespan: str, risk_mode: RiskMode, min_mag: float = 0.2
+) -> List[PickResult]:
+    """
+    Main entry point for the UI:
+
+    1. Fetch stats via vlrggapi (through fetch_vlr_segments).
+    2. Build clean player structures.
+    3. For each stat (kills, assists), across all players at once:
+       - compute projection
+       - synthesize line
+       - compute spread, edge, probability and confidence
+       - derive the recommendation for the chosen risk mode
+       (each pick's explanation text is generated lazily, on first access)
+    4. Return a list of PickResult objects, sorted by absolute edge (biggest first).
+
+    Picks with |edge| < min_mag are omitted entirely (no PickResult, no
+    explanation). The default 0.2 is a quarter of the Low-confidence bound and
+    below every risk mode's threshold, so only Stay Away picks that are
+    essentially coin flips get dropped. Pass min_mag=0.0 to keep every pick.
+
+    Use build_top_picks when only the first few picks are needed.
+
+    Steps 1–3 are cached per (region, timespan) and the finished picks per
+    (region, timespan, risk_mode, min_mag), for up to CACHE_TTL_SECONDS.
+    Repeated calls are dict lookups; use clear_cache() to force fresh stats.
+    """
+    return build_top_picks(region, timespan, risk_mode, k=None, min_mag=min_mag)